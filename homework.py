@@ -15,31 +15,77 @@
     - Среднюю скорость на дистанции, в км/ч.
     - Расход энергии, в килокалориях.
 """
-import numbers
-from dataclasses import dataclass
-from typing import Dict, List, Type
+import math
+import sys
+import time
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+# Шаблон сообщения, %-форматирование быстрее f-строки для float.
+MESSAGE_FMT: str = ("Тип тренировки: %s; "
+                    "Длительность: %.3f ч.; "
+                    "Дистанция: %.3f км; "
+                    "Ср. скорость: %.3f км/ч; "
+                    "Потрачено ккал: %.3f.")
 
 
-@dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float,
+                 ) -> None:
+        self.training_type = training_type
+        self.duration = duration
+        self.distance = distance
+        self.speed = speed
+        self.calories = calories
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Поля сравниваются по порядку, как в сгенерированном dataclass.
+        return ([getattr(self, name) for name in self.__slots__]
+                == [getattr(other, name) for name in self.__slots__])
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}"
+                           for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
 
     def get_message(self) -> str:
         """Функция выводит сообщения о результате тренировки."""
 
-        return (
-            f"Тип тренировки: {self.training_type}; "
-            f"Длительность: {self.duration:.3f} ч.; "
-            f"Дистанция: {self.distance:.3f} км; "
-            f"Ср. скорость: {self.speed:.3f} км/ч; "
-            f"Потрачено ккал: {self.calories:.3f}."
-        )
+        return MESSAGE_FMT % (self.training_type, self.duration,
+                              self.distance, self.speed, self.calories)
+
+
+class _CalculationInput:
+    """Исходное значение расчёта дистанции и скорости.
+
+    При записи сбрасывает запомненные дистанцию и скорость тренировки,
+    чтобы они пересчитались по новым данным. __get__ не определён:
+    значение лежит в __dict__ экземпляра под своим именем и читается
+    оттуда напрямую, без вызова Python-кода.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self.name] = value
+        instance._distance = None
+        instance._speed = None
 
 
 class Training:
@@ -49,24 +95,45 @@ class Training:
     LEN_STEP: float = 0.65
     # Константа для перевода значений из метров в километры.
     M_IN_KM: int = 1000
+    MINUTE_PER_HOUR: int = 60  # Переменная для перевода часов в минуты.
+    # Название вида тренировки для сообщений; по умолчанию - имя класса.
+    TYPE_NAME: str = sys.intern("Training")
+
+    action = _CalculationInput()
+    duration = _CalculationInput()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.TYPE_NAME = sys.intern(cls.__dict__.get("TYPE_NAME", cls.__name__))
 
     def __init__(self,
                  action: int,
                  duration: float,
                  weight: float,
                  ) -> None:
-        self.action = action
-        self.duration = duration
         self.weight = weight
+        # Результаты расчётов, вычисляются один раз при первом обращении
+        # и сбрасываются при изменении action, duration и данных бассейна.
+        self._distance: Optional[float] = None
+        self._speed: Optional[float] = None
+        # У нового объекта сбрасывать нечего, поэтому исходные значения
+        # пишутся в __dict__ напрямую, минуя _CalculationInput.__set__.
+        fields = self.__dict__
+        fields["action"] = action
+        fields["duration"] = duration
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        if self._distance is None:
+            self._distance = self.action * self.LEN_STEP / self.M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
 
-        return self.get_distance() / self.duration
+        if self._speed is None:
+            self._speed = self.get_distance() / self.duration
+        return self._speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
@@ -78,17 +145,23 @@ class Training:
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
 
-        return InfoMessage(self.__class__.__name__, self.duration,
+        return InfoMessage(self.TYPE_NAME, self.duration,
                            self.get_distance(), self.get_mean_speed(),
                            self.get_spent_calories())
 
+    def show_training_message(self) -> str:
+        """Вернуть текст сообщения о тренировке без объекта InfoMessage."""
+
+        return MESSAGE_FMT % (self.TYPE_NAME, self.duration,
+                              self.get_distance(), self.get_mean_speed(),
+                              self.get_spent_calories())
+
 
 class Running(Training):
     """Тренировка: бег."""
 
     MULTIPLIER: int = 18  # Коэффициенты для расчёта формулы.
     SUBTRACTOR: int = 20
-    MINUTE_PER_HOUR: int = 60  # Переменная для перевода часов в минуты.
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
@@ -101,10 +174,8 @@ class Running(Training):
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
 
-    DEGREE: int = 2  # Степень для формулы get_spent_calories().
     WEIGHT_MULTIPLIER: float = 0.035  # Коэффициенты для расчёта формулы.
     SQUARE_OF_SPEED_MULTIPLIER: float = 0.029
-    MINUTE_PER_HOUR: int = 60  # Переменная для перевода часов в минуты.
 
     def __init__(self,
                  action: int,
@@ -117,8 +188,9 @@ class SportsWalking(Training):
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
 
+        speed = self.get_mean_speed()
         return ((self.WEIGHT_MULTIPLIER * self.weight
-                 + (pow(self.get_mean_speed(), self.DEGREE) // self.height)
+                 + (speed * speed // self.height)
                  * self.SQUARE_OF_SPEED_MULTIPLIER * self.weight)
                 * (self.duration * self.MINUTE_PER_HOUR))
 
@@ -131,6 +203,9 @@ class Swimming(Training):
     ADDENDUM: float = 1.1  # Слогаемое.
     MULTIPLIER: int = 2  # Множитель.
 
+    length_pool = _CalculationInput()
+    count_pool = _CalculationInput()
+
     def __init__(self,
                  action: int,
                  duration: float,
@@ -138,14 +213,17 @@ class Swimming(Training):
                  length_pool: float,
                  count_pool: int):
         super().__init__(action, duration, weight)
-        self.length_pool = length_pool
-        self.count_pool = count_pool
+        fields = self.__dict__
+        fields["length_pool"] = length_pool
+        fields["count_pool"] = count_pool
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
 
-        return (self.length_pool * self.count_pool / self.M_IN_KM
-                / self.duration)
+        if self._speed is None:
+            self._speed = (self.length_pool * self.count_pool / self.M_IN_KM
+                           / self.duration)
+        return self._speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
@@ -154,26 +232,226 @@ class Swimming(Training):
                 * self.MULTIPLIER * self.weight)
 
 
+# Допустимые типы значений в пакете; bool и прочие подклассы отсекаются.
+NUM_TYPES = (int, float)
+
+WORKOUT_CLASSES: Mapping[str, Type[Training]] = MappingProxyType({
+    "SWM": Swimming,
+    "RUN": Running,
+    "WLK": SportsWalking
+})
+# Поля записи в порядке аргументов конструктора каждого вида.
+PACKAGE_FIELDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "SWM": ("action", "duration", "weight", "length_pool", "count_pool"),
+    "RUN": ("action", "duration", "weight"),
+    "WLK": ("action", "duration", "weight", "height")
+})
+
+
+def check_package(workout_type: str, data: List[int]) -> Type[Training]:
+    """Проверить пакет от датчиков и вернуть класс его тренировки."""
+    # Проверка на корректный тип тренировки, число полей, на число,
+    # а так же на конечную положительную длительность.
+    try:
+        training_class = WORKOUT_CLASSES[workout_type]
+    except KeyError:
+        raise ValueError("Полученый тип или данные неккоректны!") from None
+
+    if (len(data) != len(PACKAGE_FIELDS[workout_type])
+            or not all(type(_) in NUM_TYPES for _ in data)
+            or not 0 < data[1] < math.inf):
+        raise ValueError("Полученый тип или данные неккоректны!")
+
+    return training_class
+
+
 def read_package(workout_type: str, data: List[int]) -> Training:
     """Прочитать данные полученные от датчиков."""
-    obj_code_data: Dict[str, Type[Training]] = {
-        "SWM": Swimming,
-        "RUN": Running,
-        "WLK": SportsWalking
-    }
-
-    # Проверка на число, а так же корректный тип тренировки.
-    if workout_type in obj_code_data and all(
-            [isinstance(_, numbers.Number) for _ in data]):
-        return obj_code_data[workout_type](*data)
+    return check_package(workout_type, data)(*data)
+
+
+def check_durations(durations: np.ndarray) -> None:
+    """Проверить, что все длительности конечны и положительны."""
+    # Нулевая или нечисловая длительность дала бы inf/nan вместо ошибки.
+    if not (np.isfinite(durations).all() and (durations > 0).all()):
+        raise ValueError("Полученый тип или данные неккоректны!")
+
+
+def process_batch(workout_type: str, data_matrix: ArrayLike) -> np.ndarray:
+    """Обработать пакет тренировок одного вида целиком.
+
+    Каждая строка data_matrix - данные одной тренировки в том же порядке,
+    что и для read_package. Столбцы передаются в класс тренировки как
+    массивы, поэтому формулы считаются векторно для всего пакета.
+    Возвращает массив (N, 3): дистанция, средняя скорость, калории.
+    """
+    data_matrix = np.asarray(data_matrix)
+    if (workout_type not in WORKOUT_CLASSES
+            or not np.issubdtype(data_matrix.dtype, np.number)
+            or data_matrix.ndim != 2
+            or data_matrix.shape[1] != len(PACKAGE_FIELDS[workout_type])):
+        raise ValueError("Полученый тип или данные неккоректны!")
+
+    # Фортрановский порядок: каждый столбец лежит в памяти непрерывно.
+    columns = np.asfortranarray(data_matrix, dtype=np.float64).T
+    check_durations(columns[1])
+    training = WORKOUT_CLASSES[workout_type](*columns)
+    return np.column_stack((training.get_distance(),
+                            training.get_mean_speed(),
+                            training.get_spent_calories()))
+
+
+# Запись о тренировке любого вида; неиспользуемые поля остаются нулями.
+# Счётчики хранятся как float, чтобы дробные значения не обрезались.
+TRAINING_DTYPE = np.dtype([
+    ("action", "f8"),
+    ("duration", "f8"),
+    ("weight", "f8"),
+    ("height", "f8"),
+    ("length_pool", "f8"),
+    ("count_pool", "f8"),
+    ("type", "u1"),
+])
+# Коды видов тренировок для поля type.
+TYPE_CODES: Mapping[str, int] = MappingProxyType({
+    "SWM": 0,
+    "RUN": 1,
+    "WLK": 2
+})
+# Для каждого вида: откуда в пакете брать каждое поле записи, кроме type
+# (оно последнее и дописывается отдельно); None - поля у вида нет,
+# в записи остаётся ноль.
+RECORD_LAYOUTS: Mapping[str, Tuple[Optional[int], ...]] = MappingProxyType({
+    workout_type: tuple(
+        fields.index(name) if name in fields else None
+        for name in TRAINING_DTYPE.names if name != "type")
+    for workout_type, fields in PACKAGE_FIELDS.items()
+})
+
+
+class TrainingBatch:
+    """Набор тренировок разных видов в одном структурированном массиве.
+
+    Расчёт идёт по маскам видов: для каждого вида нужные поля передаются
+    в его класс целыми столбцами. Строки сообщений собираются только
+    в get_messages.
+    """
+
+    def __init__(self, records: np.ndarray) -> None:
+        if (records.dtype != TRAINING_DTYPE
+                or not np.isin(records["type"],
+                               list(TYPE_CODES.values())).all()):
+            raise ValueError("Полученый тип или данные неккоректны!")
+        check_durations(records["duration"])
+        self.records = records
+
+    @classmethod
+    def from_packages(cls,
+                      packages: Sequence[Tuple[str, List[int]]],
+                      ) -> "TrainingBatch":
+        """Собрать набор из пакетов в формате read_package."""
+        rows = []
+        for workout_type, data in packages:
+            check_package(workout_type, data)
+            rows.append(tuple(0 if index is None else data[index]
+                              for index in RECORD_LAYOUTS[workout_type])
+                        + (TYPE_CODES[workout_type],))
+        return cls(np.array(rows, dtype=TRAINING_DTYPE))
+
+    def get_results(self) -> np.ndarray:
+        """Рассчитать массив (N, 3): дистанция, средняя скорость, калории."""
+        results = np.empty((len(self.records), 3), dtype=np.float64)
+        for workout_type, code in TYPE_CODES.items():
+            mask = self.records["type"] == code
+            if not mask.any():
+                continue
+            selected = self.records[mask]
+            training = WORKOUT_CLASSES[workout_type](
+                *(selected[field] for field in PACKAGE_FIELDS[workout_type]))
+            results[mask, 0] = training.get_distance()
+            results[mask, 1] = training.get_mean_speed()
+            results[mask, 2] = training.get_spent_calories()
+        return results
+
+    def get_messages(self) -> List[str]:
+        """Вернуть сообщения о всех тренировках набора по порядку."""
+        type_names = {code: WORKOUT_CLASSES[workout_type].TYPE_NAME
+                      for workout_type, code in TYPE_CODES.items()}
+        return [
+            MESSAGE_FMT % (type_names[code], duration, *result)
+            for code, duration, result in zip(self.records["type"],
+                                              self.records["duration"],
+                                              self.get_results())
+        ]
+
+
+class TrainingAggregator:
+    """Накопитель пакетов одного вида тренировки.
+
+    Пакеты копятся в буфере и обрабатываются разом через process_batch,
+    наружу уходит одно сообщение на окно в flush_interval_s секунд.
+    Режим mode задаёт способ свёртки окна: "sum" - суммарные длительность,
+    дистанция и калории, "mean" - средние значения, "latest" - последняя
+    тренировка. Скорость в режиме "sum" усредняется с весом длительности.
+    """
+
+    MODES = ("sum", "mean", "latest")
 
-    raise ValueError("Полученый тип или данные неккоректны!")
+    def __init__(self,
+                 workout_type: str,
+                 flush_interval_s: float,
+                 mode: str = "sum",
+                 ) -> None:
+        if workout_type not in WORKOUT_CLASSES or mode not in self.MODES:
+            raise ValueError("Полученый тип или данные неккоректны!")
+        self.workout_type = workout_type
+        self.flush_interval_s = flush_interval_s
+        self.mode = mode
+        self._buf: List[List[int]] = []
+        self._last_flush = time.monotonic()
+
+    def push(self, data: List[int]) -> Optional[InfoMessage]:
+        """Добавить пакет, по истечении окна вернуть сообщение."""
+        check_package(self.workout_type, data)
+        self._buf.append(data)
+        if time.monotonic() - self._last_flush >= self.flush_interval_s:
+            return self.flush()
+        return None
+
+    def has_pending(self) -> bool:
+        """Есть ли в буфере необработанные пакеты."""
+        return bool(self._buf)
+
+    def flush(self) -> InfoMessage:
+        """Обработать накопленные пакеты и вернуть одно сообщение."""
+        if not self._buf:
+            raise ValueError("Нет данных для обработки!")
+
+        # Буфер очищается и при ошибке, чтобы она не блокировала окна.
+        rows, self._buf = self._buf, []
+        try:
+            durations = np.array([row[1] for row in rows], dtype=np.float64)
+            results = process_batch(self.workout_type, np.array(rows))
+        finally:
+            self._last_flush = time.monotonic()
+
+        training_type = WORKOUT_CLASSES[self.workout_type].TYPE_NAME
+        if self.mode == "latest":
+            return InfoMessage(training_type, durations[-1], *results[-1])
+        if self.mode == "mean":
+            return InfoMessage(training_type, durations.mean(),
+                               *results.mean(axis=0))
+
+        total_duration = durations.sum()
+        distance, _, calories = results.sum(axis=0)
+        speed = (results[:, 1] * durations).sum() / total_duration
+        return InfoMessage(training_type, total_duration,
+                           distance, speed, calories)
 
 
 def main(exercise: Training) -> None:
     """Главная функция."""
-    info = exercise.show_training_info()
-    print(info.get_message())
+    print(exercise.show_training_message())
 
 
 if __name__ == '__main__':
@@ -183,6 +461,20 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
+    # Один накопитель на вид тренировки, сообщения уходят по окнам.
+    # Сообщения копятся в списке и выводятся одной записью в stdout.
+    messages: List[str] = []
+    aggregators: Dict[str, TrainingAggregator] = {}
     for key, value in packages:
-        training = read_package(key, value)
-        main(training)
+        if key not in aggregators:
+            aggregators[key] = TrainingAggregator(key, flush_interval_s=1.0)
+        info = aggregators[key].push(value)
+        if info is not None:
+            messages.append(info.get_message())
+
+    for aggregator in aggregators.values():
+        if aggregator.has_pending():
+            messages.append(aggregator.flush().get_message())
+
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
@@ -1,7 +1,11 @@
 import re
+import sys
 import pytest
 import types
 import inspect
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
 from conftest import Capturing
 
 try:
@@ -41,6 +45,21 @@ def test_read_package_return(input_data, expected):
     )
 
 
+@pytest.mark.parametrize('input_data', [
+    ('BIKE', [720, 1, 80]),
+    ('RUN', [15000, '1', 75]),
+    ('WLK', [9000, 1, None, 180]),
+    ('RUN', [15000, True, 75]),
+    ('RUN', [15000, Decimal('1'), 75]),
+    ('RUN', [15000, Fraction(1, 2), 75]),
+    ('RUN', [np.int64(15000), 1, 75]),
+    ('RUN', [15000, 0, 75]),
+])
+def test_read_package_invalid(input_data):
+    with pytest.raises(ValueError):
+        homework.read_package(*input_data)
+
+
 def test_InfoMessage():
     assert inspect.isclass(homework.InfoMessage), (
         'Проверьте, что `InfoMessage` - это класс.'
@@ -55,6 +74,18 @@ def test_InfoMessage():
         )
 
 
+def test_InfoMessage_eq_repr():
+    info_message = homework.InfoMessage('Running', 1, 2, 3, 4)
+    assert info_message == homework.InfoMessage('Running', 1, 2, 3, 4), (
+        'Объекты `InfoMessage` с одинаковыми данными должны быть равны.'
+    )
+    assert repr(info_message) == (
+        "InfoMessage(training_type='Running', duration=1, "
+        "distance=2, speed=3, calories=4)"
+    )
+    assert not hasattr(info_message, '__dict__')
+
+
 @pytest.mark.parametrize('input_data, expected', [
     (['Swimming', 1, 75, 1, 80],
         'Тип тренировки: Swimming; '
@@ -205,6 +236,50 @@ def test_Training_show_training_info(monkeypatch):
     )
 
 
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+])
+def test_Training_show_training_message(input_data):
+    training = homework.read_package(*input_data)
+    assert hasattr(training, 'show_training_message'), (
+        'Создайте метод `show_training_message` в классе `Training`.'
+    )
+    result = training.show_training_message()
+    assert result == training.show_training_info().get_message(), (
+        'Метод `show_training_message` должен возвращать тот же текст, '
+        'что и `InfoMessage.get_message`.'
+    )
+
+
+@pytest.mark.parametrize('cls', ['Swimming', 'Running', 'SportsWalking'])
+def test_Training_TYPE_NAME(cls):
+    training_class = getattr(homework, cls)
+    assert training_class.TYPE_NAME == cls, (
+        f'Атрибут `TYPE_NAME` класса `{cls}` должен совпадать '
+        'с именем класса.'
+    )
+    assert training_class.TYPE_NAME is sys.intern(training_class.__name__), (
+        f'Атрибут `TYPE_NAME` класса `{cls}` должен быть '
+        'интернированной строкой.'
+    )
+
+
+def test_Training_TYPE_NAME_override():
+    class CustomRunning(homework.Running):
+        TYPE_NAME = ''.join(['Бег', ' по ', 'стадиону'])
+
+    class PlainRunning(CustomRunning):
+        pass
+
+    assert CustomRunning.TYPE_NAME == 'Бег по стадиону', (
+        'Заданный в классе `TYPE_NAME` не должен перезаписываться.'
+    )
+    assert CustomRunning.TYPE_NAME is sys.intern('Бег по стадиону')
+    assert PlainRunning.TYPE_NAME == 'PlainRunning'
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -363,3 +438,190 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('workout_type, rows', [
+    ('SWM', [[720, 1, 80, 25, 40], [420, 4, 20, 42, 4], [1206, 12, 6, 12, 6]]),
+    ('RUN', [[9000, 1, 75], [420, 4, 20], [1206, 12, 6]]),
+    ('WLK', [[9000, 1, 75, 180], [420, 4, 20, 42], [1206, 12, 6, 12]]),
+])
+def test_process_batch(workout_type, rows):
+    assert hasattr(homework, 'process_batch'), (
+        'Создайте функцию пакетной обработки - `process_batch`'
+    )
+    result = homework.process_batch(workout_type, np.array(rows))
+    assert result.shape == (len(rows), 3), (
+        'Функция `process_batch` должна возвращать массив (N, 3).'
+    )
+    for row, (distance, speed, calories) in zip(rows, result):
+        training = homework.read_package(workout_type, row)
+        assert distance == training.get_distance()
+        assert speed == training.get_mean_speed()
+        assert calories == training.get_spent_calories(), (
+            'Результаты `process_batch` должны совпадать с расчётом '
+            'для отдельной тренировки.'
+        )
+
+
+@pytest.mark.parametrize('workout_type, data_matrix', [
+    ('BIKE', [[9000, 1, 75]]),
+    ('RUN', [[9000, 1, 75, 180]]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [[9000, 1, 75], [420, 0, 20]]),
+    ('RUN', [[9000, -1, 75]]),
+    ('RUN', [[9000, float('nan'), 75]]),
+    ('RUN', [[9000, float('inf'), 75]]),
+    ('RUN', [['15000', '1', '75']]),
+])
+def test_process_batch_invalid(workout_type, data_matrix):
+    with pytest.raises(ValueError):
+        homework.process_batch(workout_type, np.array(data_matrix))
+
+
+def test_process_batch_accepts_list():
+    result = homework.process_batch('RUN', [[15000, 1, 75]])
+    assert result.tolist() == [[9.75, 9.75, 699.75]]
+    with pytest.raises(ValueError):
+        homework.process_batch('RUN', [15000, 1, 75])
+
+
+@pytest.mark.parametrize('mode, expected', [
+    ('sum', (3, 10.725, 3.575, 598.725)),
+    ('mean', (1.5, 5.3625, 5.11875, 299.3625)),
+    ('latest', (2, 0.975, 0.4875, -101.025)),
+])
+def test_TrainingAggregator_flush(mode, expected):
+    assert hasattr(homework, 'TrainingAggregator'), (
+        'Создайте класс `TrainingAggregator`'
+    )
+    aggregator = homework.TrainingAggregator('RUN', 3600, mode=mode)
+    assert aggregator.push([15000, 1, 75]) is None
+    assert aggregator.push([1500, 2, 75]) is None
+    info = aggregator.flush()
+    assert info.training_type == 'Running'
+    result = (info.duration, info.distance, info.speed, info.calories)
+    assert result == pytest.approx(expected), (
+        'Проверьте свёртку пакетов в `TrainingAggregator.flush`'
+    )
+    assert not aggregator.has_pending()
+
+
+def test_TrainingAggregator_push_flushes_window():
+    aggregator = homework.TrainingAggregator('WLK', 0)
+    info = aggregator.push([9000, 1, 75, 180])
+    assert info is not None, (
+        'Метод `push` должен возвращать сообщение по истечении окна.'
+    )
+    assert info.get_message() == (
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.'
+    )
+    with pytest.raises(ValueError):
+        aggregator.flush()
+
+
+@pytest.mark.parametrize('bad_packet', [
+    [15000, '1x', 75],
+    [15000, True, 75],
+    [15000, 1],
+    [15000, 0, 75],
+    [15000, -1, 75],
+    [15000, float('nan'), 75],
+])
+def test_TrainingAggregator_rejects_bad_packet(bad_packet):
+    aggregator = homework.TrainingAggregator('RUN', 3600)
+    with pytest.raises(ValueError):
+        aggregator.push(bad_packet)
+    assert not aggregator.has_pending(), (
+        'Некорректный пакет не должен попадать в буфер.'
+    )
+    aggregator.push([15000, 1, 75])
+    info = aggregator.flush()
+    assert (info.distance, info.calories) == (9.75, 699.75), (
+        'После некорректного пакета накопитель должен работать дальше.'
+    )
+
+
+def test_TrainingAggregator_zero_duration_keeps_window():
+    aggregator = homework.TrainingAggregator('RUN', 3600)
+    aggregator.push([15000, 1, 75])
+    aggregator.push([15000, 2, 75])
+    with pytest.raises(ValueError):
+        aggregator.push([100, 0, 75])
+    assert aggregator.has_pending(), (
+        'Пакет с нулевой длительностью не должен сбрасывать окно.'
+    )
+    info = aggregator.flush()
+    assert (info.duration, info.distance) == (3, 19.5)
+
+
+def test_TrainingAggregator_flush_error_clears_buffer(monkeypatch):
+    aggregator = homework.TrainingAggregator('RUN', 3600)
+    aggregator.push([15000, 1, 75])
+
+    def broken_process_batch(*args):
+        raise ValueError('boom')
+    monkeypatch.setattr(homework, 'process_batch', broken_process_batch)
+    with pytest.raises(ValueError):
+        aggregator.flush()
+    monkeypatch.undo()
+    assert not aggregator.has_pending()
+    aggregator.push([1500, 2, 75])
+    assert aggregator.flush().distance == 0.975
+
+
+def test_TrainingBatch():
+    assert hasattr(homework, 'TrainingBatch'), 'Создайте класс `TrainingBatch`'
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [15000, 1, 75]),
+        ('RUN', [15000.7, 1, 75]),
+        ('SWM', [720, 1, 80, 25, 40.5]),
+    ]
+    batch = homework.TrainingBatch.from_packages(packages)
+    results = batch.get_results()
+    assert results.shape == (len(packages), 3), (
+        'Метод `get_results` должен возвращать массив (N, 3).'
+    )
+    messages = batch.get_messages()
+    for package, result, message in zip(packages, results, messages):
+        training = homework.read_package(*package)
+        assert tuple(result) == (training.get_distance(),
+                                 training.get_mean_speed(),
+                                 training.get_spent_calories()), (
+            'Результаты `TrainingBatch` должны совпадать с расчётом '
+            'для отдельной тренировки.'
+        )
+        assert message == training.show_training_message()
+    with pytest.raises(ValueError):
+        homework.TrainingBatch.from_packages([('RUN', [15000, 1])])
+
+
+@pytest.mark.parametrize('packages', [
+    [('RUN', ['15000', 1, 75])],
+    [('RUN', [15000, True, 75])],
+    [('BIKE', [15000, 1, 75])],
+])
+def test_TrainingBatch_from_packages_invalid(packages):
+    with pytest.raises(ValueError):
+        homework.TrainingBatch.from_packages(packages)
+
+
+def test_TrainingBatch_zero_duration():
+    records = np.zeros(1, dtype=homework.TRAINING_DTYPE)
+    records['type'] = homework.TYPE_CODES['RUN']
+    with pytest.raises(ValueError):
+        homework.TrainingBatch(records)
+
+
+def test_TrainingBatch_unknown_type_code():
+    records = np.zeros(1, dtype=homework.TRAINING_DTYPE)
+    records['duration'] = 1
+    records['type'] = 7
+    with pytest.raises(ValueError):
+        homework.TrainingBatch(records)